@@ -4,101 +4,271 @@
 import pandas as pd
 import numpy as np
 import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+
+IDENTIFIER_UNIQUE_SHARE = 0.9
+IDENTIFIER_SAMPLE_SIZE = 1024
+CONVERSION_SUCCESS_SHARE = 0.9
+CONVERSION_SAMPLE_SIZE = 1024
+SKEW_LIMIT = 0.5
+IQR_FENCE = 1.5
+HIGH_RISK_MISSING_PERCENT = 30
+NEEDS_CLEANING_MISSING_PERCENT = 5
+HIGH_RISK_OUTLIER_SHARE = 0.1
+HIGH_RISK_DATASET_SHARE = 0.4
+CATEGORY_UNIQUE_SHARE = 0.5
+NUMERIC_KINDS = "biuf"
+QUARTILE_LEVELS = np.array([0.25, 0.75])
+SNIFF_ROWS = 1000
+NUMBER_FORMATTING = re.compile(r"[$,%]")
+REPORT_COLUMNS = [
+    "column",
+    "data_type",
+    "missing_count",
+    "missing_percent",
+    "distorted",
+    "unstable",
+    "outlier_count"
+]
+REPORT_DTYPES = {
+    "missing_count": "int64",
+    "missing_percent": "float64",
+    "distorted": "bool",
+    "unstable": "bool",
+    "outlier_count": "int64"
+}
+
+
+def check_if_identifier(values, total_rows):
+
+    if len(values) < 2 or len(values) < total_rows * IDENTIFIER_UNIQUE_SHARE:
+        return False
 
+    is_float = values.dtype.kind == "f"
+    sample = values[::max(1, len(values) // IDENTIFIER_SAMPLE_SIZE)]
 
+    if is_float and np.any(sample != np.floor(sample)):
+        return False
 
-def check_if_identifier(col_data, total_rows):
-
-    if not pd.api.types.is_numeric_dtype(col_data):
+    if len(pd.unique(sample)) != len(sample):
         return False
 
+    if is_float and np.any(values != np.floor(values)):
+        return False
 
-    if col_data.nunique() < total_rows * 0.9:
+    if len(pd.unique(values)) != len(values):
         return False
 
-    
-    sorted_values = col_data.dropna().sort_values()
-    differences = sorted_values.diff().dropna()
+    if values.dtype.kind == "b" or (
+            is_float and np.all(np.abs(values) < 2 ** 53)):
+        values = values.astype(np.int64)
+
+    if values.dtype.kind in "iu":
+        # unsigned offsets, so spans wider than the int64 range do not wrap
+        offsets = values.astype(np.uint64) - values.min().astype(np.uint64)
+        span = int(offsets.max())
+
+        if span % (len(values) - 1) != 0:
+            return False
 
-    if differences.nunique() == 1:
-        return True
+        step = np.uint64(span // (len(values) - 1))
 
-    return False
+        return bool(np.all(offsets % step == 0))
+
+    differences = np.diff(np.sort(values.astype(np.float64)))
+
+    return bool(np.all(differences == differences[0]))
 
 
 def convert_text_to_number(col_data):
 
-    cleaned = col_data.astype(str)
-    cleaned = cleaned.str.replace("$", "", regex=False)
-    cleaned = cleaned.str.replace(",", "", regex=False)
-    cleaned = cleaned.str.replace("%", "", regex=False)
+    if isinstance(col_data.dtype, pd.CategoricalDtype):
+        codes = col_data.cat.codes.to_numpy()
+        uniques = col_data.cat.categories
+    else:
+        codes, uniques = pd.factorize(col_data)
+
+    total_rows = len(col_data)
+    row_counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    failed_rows = total_rows - row_counts.sum()
+    converted_uniques = np.full(len(uniques), np.nan)
+
+    # most frequent values first, so a text column is rejected early
+    order = np.argsort(-row_counts, kind="stable")
+    start = 0
+    batch_size = CONVERSION_SAMPLE_SIZE
+
+    while start < len(order):
+        positions = order[start:start + batch_size]
+        cleaned = uniques[positions].astype(str).str.replace(
+            NUMBER_FORMATTING, "", regex=True
+        )
+        converted = pd.to_numeric(cleaned, errors="coerce").to_numpy(
+            dtype=np.float64,
+            na_value=np.nan
+        )
+        converted_uniques[positions] = converted
+        failed_rows += row_counts[positions][np.isnan(converted)].sum()
+        best_success = (total_rows - failed_rows) / total_rows
+
+        if best_success < CONVERSION_SUCCESS_SHARE:
+            return None, best_success
 
-    numeric_version = pd.to_numeric(cleaned, errors="coerce")
+        start += batch_size
+        batch_size *= 2
+
+    numeric_version = pd.Series(
+        np.append(converted_uniques, np.nan)[codes],
+        index=col_data.index,
+        name=col_data.name
+    )
     conversion_success = numeric_version.notna().mean()
 
     return numeric_version, conversion_success
 
 
-def analyze_one_column(col_name, col_data, total_rows):
+def column_quartiles(column, valid_mask, valid_count):
 
-    missing_count = col_data.isna().sum()
-    missing_percent = (missing_count / total_rows) * 100
+    if valid_count == 0:
+        return np.nan, np.nan
 
-    column_type = ""
-    is_distorted = False
-    is_unstable = False
-    number_of_outliers = 0
-    trust_level = ""
-    notes = ""
+    if valid_count < len(column):
+        column = column[valid_mask]
+    else:
+        column = column.copy()
 
-    if check_if_identifier(col_data, total_rows):
-        return [
-            col_name,
-            "Identifier",
-            missing_count,
-            round(missing_percent, 2),
-            False,
-            False,
-            0,
-            "Ignored",
-            "Identifier column"
-        ]
+    positions = (valid_count - 1) * QUARTILE_LEVELS
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, valid_count - 1)
+    column.partition(np.unique(np.concatenate([lower, upper])))
 
-    if pd.api.types.is_numeric_dtype(col_data):
-        numeric_values = col_data.dropna()
-        column_type = "Numeric"
+    # same linear interpolation as np.quantile
+    below = column[lower]
+    above = column[upper]
+    weight = positions - lower
 
-    else:
-        converted_values, success_rate = convert_text_to_number(col_data)
+    with np.errstate(invalid="ignore"):
+        gap = above - below
 
-        if success_rate >= 0.9:
-            numeric_values = converted_values.dropna()
-            column_type = "Numeric (converted)"
+        return np.where(
+            weight >= 0.5,
+            above - gap * (1 - weight),
+            below + gap * weight
+        )
+
+
+def block_quartiles(values, valid_mask, valid_count):
+
+    columns = range(values.shape[1])
+
+    with ThreadPoolExecutor() as executor:
+        quartiles = list(executor.map(
+            column_quartiles,
+            [values[:, index] for index in columns],
+            [valid_mask[:, index] for index in columns],
+            valid_count
+        ))
+
+    q1, q3 = np.array(quartiles, dtype=np.float64).reshape(-1, 2).T
+
+    return q1, q3
+
+
+def summarize_numeric_block(values):
+
+    valid_mask = ~np.isnan(values)
+    valid_count = np.count_nonzero(valid_mask, axis=0)
+    reduce_where = valid_mask if np.any(valid_count < len(values)) else True
+
+    q1, q3 = block_quartiles(values, valid_mask, valid_count)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_value = (
+            values.sum(axis=0, dtype=np.float64, where=reduce_where) / valid_count
+        ).astype(values.dtype)
+        centered = values - mean_value
+        moment = centered * centered
+        m2 = moment.sum(axis=0, where=reduce_where)
+        moment *= centered
+        m3 = moment.sum(axis=0, where=reduce_where)
+
+        std_value = np.sqrt(m2 / (valid_count - 1))
+
+        # same bias-corrected estimator and rounding tolerances as pandas Series.skew
+        max_abs = np.maximum(
+            values.max(axis=0, initial=0.0, where=reduce_where),
+            -values.min(axis=0, initial=0.0, where=reduce_where)
+        )
+        rounding_error = np.finfo(m2.dtype).eps * max_abs
+        m2 = np.where(np.abs(m2) < rounding_error ** 2 * valid_count, 0.0, m2)
+        m3 = np.where(np.abs(m3) < rounding_error ** 3 * valid_count, 0.0, m3)
+        skew_value = (
+            valid_count * np.sqrt(valid_count - 1) / (valid_count - 2)
+        ) * (m3 / m2 ** 1.5)
+        skew_value = np.where(m2 == 0, 0.0, skew_value)
+        skew_value = np.where(valid_count < 3, np.nan, skew_value)
+
+    iqr_value = q3 - q1
+    lower_limit = q1 - IQR_FENCE * iqr_value
+    upper_limit = q3 + IQR_FENCE * iqr_value
+
+    outside_limits = np.less(values, lower_limit)
+    np.logical_or(
+        outside_limits,
+        np.greater(values, upper_limit),
+        out=outside_limits
+    )
+    outlier_count = np.count_nonzero(outside_limits, axis=0)
+
+    is_distorted = np.abs(skew_value) > SKEW_LIMIT
+    is_unstable = (iqr_value > 0) & (std_value > iqr_value)
+
+    return {
+        "count": valid_count,
+        "std": std_value,
+        "q1": q1,
+        "q3": q3,
+        "skew": skew_value,
+        "outliers": outlier_count,
+        "distorted": is_distorted,
+        "unstable": is_unstable
+    }
+
+
+def profile_column(col_data, total_rows, missing_count):
+
+    if col_data.dtype.kind in NUMERIC_KINDS:
+        if missing_count == 0:
+            present_values = col_data.to_numpy()
         else:
-            column_type = "Categorical"
-
-            if missing_percent >= 30:
-                trust_level = "High Risk"
-            elif missing_percent >= 5:
-                trust_level = "Needs Cleaning"
-            else:
-                trust_level = "Reliable"
-
-            notes = "Categorical column"
-
-            return [
-                col_name,
-                column_type,
-                missing_count,
-                round(missing_percent, 2),
-                False,
-                False,
-                0,
-                trust_level,
-                notes
-            ]
-
-    if len(numeric_values) == 0:
+            present_values = col_data.dropna().to_numpy()
+
+        if len(present_values) == 0 or (
+                present_values[0] == present_values[-1]
+                and present_values.min() == present_values.max()):
+            return "Numeric", None
+
+        if check_if_identifier(present_values, total_rows):
+            return "Identifier", None
+
+        return "Numeric", col_data
+
+    converted_values, success_rate = convert_text_to_number(col_data)
+
+    if success_rate >= CONVERSION_SUCCESS_SHARE:
+        return "Numeric (converted)", converted_values
+
+    return "Categorical", None
+
+
+def build_column_result(col_name, column_type, missing_count, total_rows, stats=None):
+
+    missing_percent = (missing_count / total_rows) * 100
+
+    if stats is None:
         return [
             col_name,
             column_type,
@@ -106,92 +276,158 @@ def analyze_one_column(col_name, col_data, total_rows):
             round(missing_percent, 2),
             False,
             False,
-            0,
-            "High Risk",
-            "All values missing"
+            0
         ]
-    
-    std_value = numeric_values.std()
-    q1 = numeric_values.quantile(0.25)
-    q3 = numeric_values.quantile(0.75)
-    iqr_value = q3 - q1
-    skew_value = numeric_values.skew()
 
-    if abs(skew_value) > 0.5:
-        is_distorted = True
-
-    if iqr_value > 0 and std_value > iqr_value:
-        is_unstable = True
+    return [
+        col_name,
+        column_type,
+        missing_count,
+        round(missing_percent, 2),
+        bool(stats["distorted"]),
+        bool(stats["unstable"]),
+        int(stats["outliers"])
+    ]
 
-    lower_limit = q1 - 1.5 * iqr_value
-    upper_limit = q3 + 1.5 * iqr_value
 
-    outliers = numeric_values[
-        (numeric_values < lower_limit) |
-        (numeric_values > upper_limit)
+def classify_columns(report_df, total_rows):
+
+    data_type = report_df["data_type"].to_numpy()
+    missing_count = report_df["missing_count"].to_numpy()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        missing_percent = (missing_count / total_rows) * 100
+
+    is_categorical = data_type == "Categorical"
+    many_missing = missing_percent >= HIGH_RISK_MISSING_PERCENT
+    some_missing = missing_percent >= NEEDS_CLEANING_MISSING_PERCENT
+    many_outliers = (
+        report_df["outlier_count"].to_numpy() > total_rows * HIGH_RISK_OUTLIER_SHARE
+    )
+    distribution_issues = (
+        report_df["distorted"].to_numpy()
+        | report_df["unstable"].to_numpy()
+        | some_missing
+    )
+
+    rules = [
+        (data_type == "Identifier", "Ignored", "Identifier column"),
+        (is_categorical & many_missing, "High Risk", "Categorical column"),
+        (is_categorical & some_missing, "Needs Cleaning", "Categorical column"),
+        (is_categorical, "Reliable", "Categorical column"),
+        (missing_count == total_rows, "High Risk", "All values missing"),
+        (many_missing, "High Risk", "Too many missing values"),
+        (many_outliers, "High Risk", "Too many outliers"),
+        (distribution_issues, "Needs Cleaning", "Distribution issues detected")
     ]
+    conditions = [condition for condition, _, _ in rules]
 
-    number_of_outliers = len(outliers)
+    report_df["trust"] = np.select(
+        conditions,
+        [trust for _, trust, _ in rules],
+        default="Reliable"
+    ).tolist()
+    report_df["remarks"] = np.select(
+        conditions,
+        [remarks for _, _, remarks in rules],
+        default="Column is reliable"
+    ).tolist()
 
+    return report_df
 
-    if missing_percent >= 30:
-        trust_level = "High Risk"
-        notes = "Too many missing values"
 
-    elif number_of_outliers > total_rows * 0.1:
-        trust_level = "High Risk"
-        notes = "Too many outliers"
+def sniff_text_columns(file_path, usecols=None):
 
-    elif is_distorted or is_unstable or missing_percent >= 5:
-        trust_level = "Needs Cleaning"
-        notes = "Distribution issues detected"
+    head = pd.read_csv(file_path, nrows=SNIFF_ROWS, usecols=usecols)
 
-    else:
-        trust_level = "Reliable"
-        notes = "Column is reliable"
+    return {
+        column_name: "category"
+        for column_name, dtype in head.dtypes.items()
+        if dtype.kind not in NUMERIC_KINDS
+        and head[column_name].nunique() < len(head) * CATEGORY_UNIQUE_SHARE
+    }
 
-    return [
-        col_name,
-        column_type,
-        missing_count,
-        round(missing_percent, 2),
-        is_distorted,
-        is_unstable,
-        number_of_outliers,
-        trust_level,
-        notes
-    ]
 
-def analyze_dataset(file_path):
+def read_dataset(file_path, usecols=None):
 
-    data = pd.read_csv(file_path)
-    total_rows = len(data)
+    text_dtypes = None
 
-    final_report = []
+    # buffers and URLs can only be read once, so only local files are sniffed
+    if isinstance(file_path, (str, os.PathLike)) and os.path.isfile(file_path):
+        text_dtypes = sniff_text_columns(file_path, usecols)
+
+    data = pd.read_csv(file_path, usecols=usecols, dtype=text_dtypes)
 
     for column_name in data.columns:
-        column_result = analyze_one_column(
+        col_data = data[column_name]
+
+        if (col_data.dtype.kind not in NUMERIC_KINDS
+                and not isinstance(col_data.dtype, pd.CategoricalDtype)
+                and col_data.nunique() < len(data) * CATEGORY_UNIQUE_SHARE):
+            data[column_name] = col_data.astype("category")
+
+    return data
+
+
+def analyze_dataset(file_path, usecols=None, precision=np.float64):
+
+    data = read_dataset(file_path, usecols)
+    total_rows = len(data)
+
+    missing_counts = data.isna().sum(axis=0).to_numpy()
+
+    with ThreadPoolExecutor() as executor:
+        pending_profiles = [
+            executor.submit(profile_column, col_data, total_rows, missing_count)
+            for (_, col_data), missing_count in zip(data.items(), missing_counts)
+        ]
+        profiles = [profile.result() for profile in pending_profiles]
+
+    numeric_positions = [
+        position
+        for position, (_, numeric_values) in enumerate(profiles)
+        if numeric_values is not None
+    ]
+    column_stats = [None] * len(profiles)
+
+    if numeric_positions:
+        numeric_block = np.empty(
+            (total_rows, len(numeric_positions)),
+            dtype=precision,
+            order="F"
+        )
+
+        for index, position in enumerate(numeric_positions):
+            numeric_block[:, index] = profiles[position][1].to_numpy()
+
+        block_stats = summarize_numeric_block(numeric_block)
+
+        for index, position in enumerate(numeric_positions):
+            column_stats[position] = {
+                name: values[index] for name, values in block_stats.items()
+            }
+
+    final_report = [
+        build_column_result(
             column_name,
-            data[column_name],
-            total_rows
+            column_type,
+            missing_count,
+            total_rows,
+            stats
         )
-        final_report.append(column_result)
-
-    report_df = pd.DataFrame(final_report, columns=[
-        "column",
-        "data_type",
-        "missing_count",
-        "missing_percent",
-        "distorted",
-        "unstable",
-        "outlier_count",
-        "trust",
-        "remarks"
-    ])
-
-    high_risk_columns = (report_df["trust"] == "High Risk").sum()
-
-    if high_risk_columns > len(report_df) * 0.4:
+        for column_name, (column_type, _), missing_count, stats
+        in zip(data.columns, profiles, missing_counts, column_stats)
+    ]
+
+    report_df = pd.DataFrame.from_records(
+        final_report,
+        columns=REPORT_COLUMNS
+    ).astype(REPORT_DTYPES)
+    report_df = classify_columns(report_df, total_rows)
+
+    high_risk_columns = Counter(report_df["trust"])["High Risk"]
+
+    if high_risk_columns > len(report_df) * HIGH_RISK_DATASET_SHARE:
         overall_verdict = "Dataset is NOT reliable"
     elif high_risk_columns > 0:
         overall_verdict = "Dataset needs cleaning"
@@ -0,0 +1,100 @@
+import io
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from main import (
+    analyze_dataset,
+    check_if_identifier,
+    read_dataset,
+    summarize_numeric_block
+)
+
+
+def test_skew_matches_pandas_on_small_scale_column():
+
+    rng = np.random.default_rng(0)
+    values = rng.exponential(size=500) * 1e-9
+    values[::50] = np.nan
+
+    stats = summarize_numeric_block(values.reshape(-1, 1))
+
+    assert np.isclose(stats["skew"][0], pd.Series(values).skew())
+    assert stats["distorted"][0]
+
+
+def test_skew_is_zero_for_constant_column():
+
+    values = np.full(200, 1234.567)
+
+    stats = summarize_numeric_block(values.reshape(-1, 1))
+
+    assert stats["skew"][0] == pd.Series(values).skew() == 0
+
+
+def test_analyze_dataset_reads_a_buffer_once():
+
+    csv_text = "id,city,price\n" + "".join(
+        f"{row},{'ab'[row % 2]},${row * 3 % 7}\n" for row in range(50)
+    )
+
+    report, _ = analyze_dataset(io.StringIO(csv_text))
+
+    assert report["data_type"].tolist() == [
+        "Identifier",
+        "Categorical",
+        "Numeric (converted)"
+    ]
+
+
+def test_read_dataset_keeps_high_cardinality_text_as_strings(tmp_path):
+
+    csv_path = tmp_path / "urls.csv"
+    csv_path.write_text("url,city\n" + "".join(
+        f"https://example.com/{row},{'ab'[row % 2]}\n" for row in range(50)
+    ))
+
+    data = read_dataset(csv_path)
+
+    assert not isinstance(data["url"].dtype, pd.CategoricalDtype)
+    assert isinstance(data["city"].dtype, pd.CategoricalDtype)
+
+
+def test_identifier_progression_spanning_the_int64_range():
+
+    largest = np.iinfo(np.int64).max
+
+    assert check_if_identifier(np.array([-largest, largest]), 2)
+    assert check_if_identifier(np.array([-largest, 0, largest]), 3)
+    assert not check_if_identifier(np.array([-largest - 1, 0, largest]), 3)
+
+
+def test_quartiles_of_infinite_values_do_not_warn():
+
+    values = np.array([1.0, 2.0, np.inf]).reshape(-1, 1)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        stats = summarize_numeric_block(values)
+
+    assert stats["q1"][0] == 1.5
+    assert np.isnan(stats["q3"][0])
+
+
+def test_identifier_requires_integer_values():
+
+    assert not check_if_identifier(np.arange(20) * 2.5, 20)
+    assert not check_if_identifier(np.array([0.5, 1.25]), 2)
+    assert check_if_identifier(np.arange(20) * 2.0, 20)
+
+
+def test_float_identifier_with_missing_value_is_detected():
+
+    csv_text = "id,score\n" + "".join(
+        f"{row},{row * row % 11}\n" for row in range(1, 20)
+    ) + ",3\n"
+
+    report, _ = analyze_dataset(io.StringIO(csv_text))
+
+    assert report["data_type"].tolist() == ["Identifier", "Numeric"]